@@ -16,6 +16,7 @@ src_path = Path(__file__).resolve().parent.parent
 sys.path.append(str(src_path))
 
 from src.core.rtlsdr_base import RTLSDRBase, RTLSDRException
+from src.core.reader_thread import SampleReader
 from src.core.signal_processor import SignalProcessor
 from src.detection.detector import SignalDetector
 from src.visualization.plotter import SpectrumPlotter
@@ -34,6 +35,8 @@ class SignalAnalyzer:
         """Initialize analyzer with configuration."""
         self.config = config
         self.running = False
+        self._artists = []
+        self.reader = None
         
         # Initialize components
         self.rtlsdr = RTLSDRBase(
@@ -46,8 +49,10 @@ class SignalAnalyzer:
         
         self.processor = SignalProcessor(
             fft_size=config['receiver']['fft_size'],
-            sample_rate=config['receiver']['sample_rate']
+            sample_rate=config['receiver']['sample_rate'],
+            decimation=config['receiver']['decimation']
         )
+        self.freq_range = self.processor.decimate_freq_range(self.rtlsdr.freq_range)
         
         self.detector = SignalDetector(
             power_threshold=config['detector']['power_threshold'],
@@ -55,11 +60,12 @@ class SignalAnalyzer:
             z_score_threshold=config['detector']['z_score_threshold'],
             detection_window=config['detector']['detection_window'],
             min_duration=config['detector']['min_duration'],
-            test_mode=config['detector']['test_mode']
+            test_mode=config['detector']['test_mode'],
+            freq_range=self.freq_range
         )
         
         self.plotter = SpectrumPlotter(
-            freq_range=self.rtlsdr.freq_range,
+            freq_range=self.freq_range,
             waterfall_length=config['display']['waterfall_length'],
             update_interval=config['display']['update_interval']
         )
@@ -75,29 +81,30 @@ class SignalAnalyzer:
             
     def update(self, frame):
         """Update function for visualization."""
+        # Return current artists if stopped or no new data
         if not self.running:
-            return self.plotter.get_artists()  # Return artists even when not running
-            
-        try:
-            # Read and process samples
-            iq_data = self.rtlsdr.read_samples()
-            if iq_data is not None:
-                spectrum = self.processor.process_samples(iq_data)
-                if spectrum is not None:
-                    event = self.detector.detect_signal(
-                        spectrum,
-                        self.rtlsdr.freq_range,
-                        time.time()
-                    )
-                    return self.plotter.update(spectrum, event)
+            return self._artists
             
-            # Return current artists if no new data
-            return self.plotter.get_artists()
-                
-        except Exception as e:
-            logger.error(f"Error in update loop: {str(e)}")
+        # The reader exits when the RTL-TCP connection is lost
+        if not self.reader.is_alive():
+            logger.error("Sample reader stopped; shutting down")
             self.stop()
-            return self.plotter.get_artists()
+            return self._artists
+            
+        iq_data = self.reader.latest()
+        if iq_data is None:
+            return self._artists
+            
+        spectrum = self.processor.process_samples(iq_data)
+        if spectrum is None:
+            return self._artists
+            
+        event = self.detector.detect_signal(
+            spectrum,
+            self.freq_range,
+            time.time()
+        )
+        return self.plotter.update(spectrum, event)
         
     def start(self):
         """Start the analyzer."""
@@ -105,6 +112,13 @@ class SignalAnalyzer:
         self.rtlsdr.connect()
         logger.info("Starting signal analyzer...")
         
+        # Acquire samples in the background
+        self.reader = SampleReader(self.rtlsdr)
+        self.reader.start()
+        
+        # Artists returned on frames without new data
+        self._artists = self.plotter.get_artists()
+        
         # Start visualization
         self.plotter.start(self.update)
             
@@ -117,6 +131,8 @@ class SignalAnalyzer:
         # Cleanup components
         try:
             self.plotter.stop()
+            if self.reader:
+                self.reader.stop()
             self.rtlsdr._cleanup()
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
@@ -134,7 +150,8 @@ def load_config(config_path: str = None) -> dict:
         'receiver': {
             'frequency': 915e6,
             'sample_rate': 2.048e6,
-            'fft_size': 2048
+            'fft_size': 2048,
+            'decimation': 8
         },
         'detector': {
             'power_threshold': -70,
@@ -200,6 +217,11 @@ def main():
         type=int,
         help='FFT size (overrides config)'
     )
+    parser.add_argument(
+        '--decimation',
+        type=int,
+        help='FFT bins averaged per displayed bin (overrides config)'
+    )
     
     # Detector settings
     parser.add_argument(
@@ -261,6 +283,8 @@ def main():
         config['receiver']['sample_rate'] = args.sample_rate
     if args.fft_size:
         config['receiver']['fft_size'] = args.fft_size
+    if args.decimation:
+        config['receiver']['decimation'] = args.decimation
     if args.power_threshold:
         config['detector']['power_threshold'] = args.power_threshold
     if args.bandwidth_threshold:
@@ -1,2 +1,3 @@
 from src.core.rtlsdr_base import RTLSDRBase
 from src.core.signal_processor import SignalProcessor
+from src.core.reader_thread import SampleReader
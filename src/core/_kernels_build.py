@@ -0,0 +1,58 @@
+"""
+Kernel Build Script
+Compiles the kernels in fast_kernels.py ahead of time into the _rtl_kernels
+extension module, so the analyzer starts without JIT-compiling them.
+
+The AOT kernels are compiled without fastmath and are slower per frame than
+the cached JIT kernels; building them only pays off when startup time
+matters more than frame time.
+
+Usage:
+    python src/core/_kernels_build.py
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Exported kernels and their exact signatures (c8=complex64, f4=float32);
+# keep the dtypes in sync with the _prefer_aot guards in fast_kernels.py
+SIGNATURES = [
+    ('unpack_iq', 'void(u1[:], c8[:])'),
+    ('remove_dc_window', 'void(c8[:], f4[:], c8[:])'),
+    ('spectrum_db', 'void(c8[:], f4[:], i8)'),
+    ('spectrum_reduce', 'Tuple((f4, f8, i8, i8))(f4[:])'),
+]
+
+def _load_jit_kernels():
+    """Load fast_kernels.py on its own so the JIT definitions are used."""
+    # Block the AOT override in case a previous build is present
+    sys.modules['src.core._rtl_kernels'] = None
+    spec = importlib.util.spec_from_file_location(
+        '_fast_kernels_jit', os.path.join(HERE, 'fast_kernels.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def build() -> None:
+    """Compile the exported kernels into HERE/_rtl_kernels."""
+    # Keep build-time compilations out of the runtime JIT cache; numba reads
+    # this when it is first imported
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ['NUMBA_CACHE_DIR'] = cache_dir
+        from numba.pycc import CC
+
+        cc = CC('_rtl_kernels')
+        cc.output_dir = HERE
+
+        kernels = _load_jit_kernels()
+        for name, signature in SIGNATURES:
+            cc.export(name, signature)(getattr(kernels, name).py_func)
+        cc.compile()
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,146 @@
+"""
+Fast Kernels Module
+Numba-compiled kernels for the per-frame signal processing hot path.
+Kernels write into caller-owned buffers so no arrays are allocated per frame.
+"""
+
+import numpy as np
+from numba import njit
+
+# Single-precision constants keep the kernels in float32 arithmetic
+_IQ_OFFSET = np.float32(127.5)
+_IQ_SCALE = np.float32(1 / 127.5)
+_DB_SCALE = np.float32(20)
+_DB_FLOOR = np.float32(1e-12)
+
+
+@njit(cache=True, fastmath=True)
+def remove_dc_window(iq, window, out):
+    """
+    Remove the DC offset from IQ samples and apply the FFT window.
+
+    Args:
+        iq: Complex IQ samples
+        window: Window coefficients, same length as iq
+        out: Preallocated complex output buffer
+    """
+    n = iq.shape[0]
+    mean = iq.sum() / n
+    for i in range(n):
+        out[i] = (iq[i] - mean) * window[i]
+
+
+@njit(cache=True, fastmath=True)
+def spectrum_db(fft_data, out, decim):
+    """
+    Shift FFT output to centered order, convert to dB and decimate it.
+
+    Args:
+        fft_data: Unshifted complex FFT output
+        out: Preallocated output buffer of len(fft_data) // decim bins
+        decim: Number of adjacent bins averaged into each output bin
+    """
+    n = fft_data.shape[0]
+    k = n - n // 2
+    for j in range(out.shape[0]):
+        acc = 0.0
+        for _ in range(decim):
+            if k >= n:
+                k -= n
+            acc += np.log10(abs(fft_data[k]) + _DB_FLOOR)
+            k += 1
+        out[j] = _DB_SCALE * acc / decim
+
+
+@njit(cache=True, fastmath=True)
+def unpack_iq(raw, out):
+    """
+    Convert interleaved unsigned 8-bit IQ bytes into complex samples.
+
+    Args:
+        raw: Interleaved I/Q bytes, at least twice as long as out
+        out: Preallocated complex output buffer
+    """
+    for i in range(out.shape[0]):
+        out[i] = complex((np.float32(raw[2 * i]) - _IQ_OFFSET) * _IQ_SCALE,
+                         (np.float32(raw[2 * i + 1]) - _IQ_OFFSET) * _IQ_SCALE)
+
+
+@njit(cache=True, fastmath=True)
+def spectrum_reduce(s):
+    """
+    Compute peak, mean, peak index and 3dB bin count of a spectrum.
+
+    Args:
+        s: Power spectrum in dB
+
+    Returns:
+        Tuple of (max power, mean power, index of max, bins within 3dB of max)
+    """
+    n = s.shape[0]
+    peak = s[0]
+    peak_idx = 0
+    total = 0.0
+    for i in range(n):
+        v = s[i]
+        total += v
+        if v > peak:
+            peak = v
+            peak_idx = i
+
+    threshold = peak - 3
+    above = 0
+    for i in range(n):
+        if s[i] > threshold:
+            above += 1
+
+    return peak, total / n, peak_idx, above
+
+
+def _prefer_aot(aot_func, jit_func, *dtypes):
+    """
+    Dispatch to an AOT kernel when the array arguments match its signature.
+
+    AOT kernels don't check their argument types, so anything else (e.g.
+    float64 or complex128 arrays) goes to the JIT dispatcher instead.
+
+    Args:
+        aot_func: Ahead-of-time compiled kernel
+        jit_func: JIT dispatcher for the same kernel
+        dtypes: Expected dtype of each array argument, in order
+
+    Returns:
+        Kernel accepting the same arguments as jit_func
+    """
+    dtypes = tuple(np.dtype(d) for d in dtypes)
+
+    def kernel(*args):
+        for arg, dtype in zip(args, dtypes):
+            if (not isinstance(arg, np.ndarray) or arg.dtype != dtype
+                    or arg.ndim != 1):
+                return jit_func(*args)
+        return aot_func(*args)
+
+    kernel.__name__ = jit_func.__name__
+    kernel.__doc__ = jit_func.__doc__
+    return kernel
+
+
+# Use the ahead-of-time compiled kernels when they have been built with
+# _kernels_build.py. They start faster but run slower per frame than the
+# cached JIT versions above, which remain the fallback.
+try:
+    from src.core import _rtl_kernels
+except ImportError:
+    _rtl_kernels = None
+
+if _rtl_kernels is not None:
+    unpack_iq = _prefer_aot(_rtl_kernels.unpack_iq, unpack_iq,
+                            np.uint8, np.complex64)
+    remove_dc_window = _prefer_aot(_rtl_kernels.remove_dc_window,
+                                   remove_dc_window,
+                                   np.complex64, np.float32, np.complex64)
+    spectrum_db = _prefer_aot(_rtl_kernels.spectrum_db, spectrum_db,
+                              np.complex64, np.float32)
+    spectrum_reduce = _prefer_aot(_rtl_kernels.spectrum_reduce,
+                                  spectrum_reduce, np.float32)
@@ -0,0 +1,137 @@
+"""
+Sample Reader Thread Module
+Runs RTL-TCP sample acquisition on a background thread so the display
+loop never blocks on socket I/O.
+"""
+
+import logging
+import select
+import threading
+import time
+from collections import deque
+from typing import Optional
+import numpy as np
+from src.core.rtlsdr_base import RTLSDRBase, RTLSDRException
+
+logger = logging.getLogger(__name__)
+
+# One buffer held by the consumer, one being filled, one spare to swap in
+MIN_BUFFERS = 3
+
+class SampleReader(threading.Thread):
+    """Background reader handing the newest IQ block to a single consumer."""
+    
+    def __init__(self, rtlsdr: RTLSDRBase, num_buffers: int = 4):
+        """
+        Initialize the reader thread.
+        
+        Args:
+            rtlsdr: Connected RTL-SDR device to read from
+            num_buffers: Number of preallocated sample buffers
+            
+        Raises:
+            ValueError: If num_buffers is less than MIN_BUFFERS
+        """
+        if num_buffers < MIN_BUFFERS:
+            raise ValueError(
+                f"SampleReader needs at least {MIN_BUFFERS} buffers, got {num_buffers}")
+            
+        super().__init__(name='rtlsdr-reader', daemon=True)
+        self.rtlsdr = rtlsdr
+        
+        # Buffers move between the free and ready queues; deque append and
+        # pop are atomic, so no lock is needed with one producer and one
+        # consumer
+        self._free = deque(
+            np.empty(rtlsdr.fft_size, dtype=np.complex64)
+            for _ in range(num_buffers)
+        )
+        self._ready = deque()
+        self._in_use: Optional[np.ndarray] = None
+        self._stop_evt = threading.Event()
+        
+    def run(self) -> None:
+        """Read sample blocks until stopped or disconnected."""
+        logger.info("Sample reader started")
+        while not self._stop_evt.is_set():
+            sock = self.rtlsdr.sock
+            if sock is None:
+                break
+                
+            # Wait for data instead of spinning on the non-blocking socket
+            try:
+                readable, _, _ = select.select([sock], [], [], 0.1)
+            except (OSError, ValueError):
+                break
+            if not readable:
+                continue
+                
+            buf = self._acquire()
+            try:
+                samples = self.rtlsdr.read_samples(out=buf)
+            except RTLSDRException as e:
+                logger.warning(f"Sample reader disconnected: {str(e)}")
+                self._free.append(buf)
+                break
+                
+            if samples is None:
+                self._free.append(buf)
+            else:
+                self._ready.append(buf)
+                
+        logger.info("Sample reader stopped")
+        
+    def _acquire(self) -> np.ndarray:
+        """
+        Take a buffer to fill, recycling the oldest unread block if needed.
+        
+        Returns:
+            Complex64 sample buffer owned by the reader
+        """
+        while True:
+            try:
+                return self._free.popleft()
+            except IndexError:
+                pass
+            try:
+                return self._ready.popleft()
+            except IndexError:
+                pass
+                
+            # The consumer is mid-swap in latest(); let it finish
+            time.sleep(0)
+                
+    def latest(self) -> Optional[np.ndarray]:
+        """
+        Get the newest sample block, discarding older unread ones.
+        
+        Returns:
+            Complex64 sample array or None if no new block is ready. The
+            array stays valid until the next call.
+        """
+        try:
+            buf = self._ready.pop()
+        except IndexError:
+            return None
+            
+        # Drop stale blocks and release the previously returned buffer
+        while True:
+            try:
+                self._free.append(self._ready.popleft())
+            except IndexError:
+                break
+        if self._in_use is not None:
+            self._free.append(self._in_use)
+        self._in_use = buf
+        return buf
+        
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop the reader thread and wait for it to exit.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        self._stop_evt.set()
+        if self.is_alive():
+            self.join(timeout)
@@ -9,7 +9,7 @@ import socket
 import struct
 from typing import Optional, Tuple
 import numpy as np
-from scipy.signal.windows import blackmanharris
+from src.core.fast_kernels import unpack_iq
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +18,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Requested socket receive buffer; the OS may cap it (net.core.rmem_max)
+RCVBUF_SIZE = 4 * 1024 * 1024
+PAGE_SIZE = 4096
+
 class RTLSDRException(Exception):
     """Custom exception for RTL-SDR related errors."""
     pass
@@ -49,7 +53,16 @@ class RTLSDRBase:
         self.sample_rate = sample_rate
         self.fft_size = fft_size
         self.sock: Optional[socket.socket] = None
-        self.window = blackmanharris(fft_size)
+        
+        # Preallocated receive and sample buffers; each read requests a
+        # whole number of pages, at least 64 KiB, to keep syscalls per frame low
+        self._frame_bytes = fft_size * 2
+        self._rx_chunk = -(-max(self._frame_bytes, 65536) // PAGE_SIZE) * PAGE_SIZE
+        self._rx = bytearray(self._rx_chunk * 4)
+        self._rx_mv = memoryview(self._rx)
+        self._rx_raw = np.frombuffer(self._rx, dtype=np.uint8)
+        self._rx_fill = 0
+        self._iq_buf = np.empty(fft_size, dtype=np.complex64)
         
         # Calculate frequency range
         self.freq_range = np.linspace(
@@ -67,7 +80,7 @@ class RTLSDRBase:
         """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024*1024)
+            self._tune_socket()
            # self.sock.settimeout(5.0)  # 5 second timeout
             
             logger.info(f"Connecting to RTL-TCP server at {self.host}:{self.port}")
@@ -82,6 +95,24 @@ class RTLSDRBase:
             self._cleanup()
             raise RTLSDRException(f"Failed to connect to RTL-TCP server: {str(e)}")
             
+    def _tune_socket(self) -> None:
+        """
+        Configure the socket for a sustained high-rate sample stream.
+        
+        Must be called before connecting so the receive window is sized
+        during the TCP handshake.
+        """
+        # Don't let Nagle delay small command packets
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RCVBUF_SIZE)
+        granted = int(self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF))
+        if granted < RCVBUF_SIZE:
+            logger.info("Socket receive buffer limited to %d bytes; raise "
+                        "net.core.rmem_max for high sample rates", granted)
+        else:
+            logger.debug("Socket receive buffer: %d bytes", granted)
+            
     def _configure_device(self) -> None:
         """
         Configure RTL-SDR device parameters.
@@ -120,38 +151,57 @@ class RTLSDRBase:
         except socket.error as e:
             raise RTLSDRException(f"Failed to send command: {str(e)}")
     
-    def read_samples(self) -> Optional[np.ndarray]:
+    def read_samples(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Read samples from RTL-SDR device with error handling.
         
+        Args:
+            out: Optional complex64 buffer of fft_size samples to fill
+        
         Returns:
-            Complex numpy array of samples or None if no data available
+            Complex64 numpy array of samples or None if no data available.
+            Without out, the array is reused on the next call; copy it if it
+            needs to be kept.
+            
+        Raises:
+            RTLSDRException: If not connected or the server closed the connection
         """
         if self.sock is None:
             raise RTLSDRException("No connection to RTL-TCP server")
             
         try:
-            raw_data = self.sock.recv(self.fft_size * 2 * 64)
-            if not raw_data:
-                return None
+            # Drain whatever the socket has buffered, carrying partial
+            # frames over from previous calls
+            while self._rx_fill < len(self._rx):
+                try:
+                    n = self.sock.recv_into(
+                        self._rx_mv[self._rx_fill:self._rx_fill + self._rx_chunk])
+                except BlockingIOError:
+                    break
+                if not n:
+                    raise RTLSDRException("RTL-TCP server closed the connection")
+                self._rx_fill += n
                 
-            # Convert to complex samples
-            data = np.frombuffer(raw_data, dtype=np.uint8).reshape(-1, 2)
-            iq = ((data[:, 0] + 1j * data[:, 1]) - 127.5 - 127.5j) / 127.5
-            
             # Handle sample size
-            if len(iq) >= self.fft_size:
-                logger.debug("Received samples")
-                return iq[:self.fft_size]
-            else:
-                # padded = np.zeros(self.fft_size, dtype=complex)
-                # padded[:len(iq)] = iq
-                # logger.debug("Received partial samples")
+            if self._rx_fill < self._frame_bytes:
                 return None
                 
+            # Convert the newest complete frame to complex samples
+            if out is None:
+                out = self._iq_buf
+            end = self._rx_fill - self._rx_fill % 2
+            unpack_iq(self._rx_raw[end - self._frame_bytes:end], out)
+            
+            # Keep a trailing odd byte so I/Q pairs stay aligned
+            leftover = self._rx_fill - end
+            self._rx[:leftover] = self._rx[end:self._rx_fill]
+            self._rx_fill = leftover
+            
+            logger.debug("Received samples")
+            return out
+                
         except socket.error as e:
-            if e.errno != 10035:  # Ignore "would block" error
-                logger.warning(f"Error reading samples: {str(e)}")
+            logger.warning(f"Error reading samples: {str(e)}")
             return None
             
     def _cleanup(self) -> None:
@@ -1,46 +1,76 @@
 """
 Signal Processing Module
-Handles all signal processing operations including FFT, filtering,
+Handles all signal processing operations including FFT, decimation,
 and power calculations with proper error handling.
 """
 
 import logging
-from typing import Optional, Tuple
+from typing import Optional
 import numpy as np
-from scipy.fft import fft, fftshift
-from scipy.signal import butter, filtfilt
+from scipy.fft import fft, next_fast_len
+from src.core.fast_kernels import remove_dc_window, spectrum_db, spectrum_reduce
 
 logger = logging.getLogger(__name__)
 
 class SignalProcessor:
     """Handles signal processing operations for RTL-SDR data."""
     
-    def __init__(self, fft_size: int, sample_rate: float):
+    def __init__(self, fft_size: int, sample_rate: float, decimation: int = 1):
         """
         Initialize signal processor.
         
         Args:
             fft_size: Size of FFT operation
             sample_rate: Sample rate in Hz
+            decimation: Number of adjacent FFT bins averaged per output bin
+            
+        Raises:
+            ValueError: If fft_size is not a multiple of decimation
         """
+        if decimation < 1 or fft_size % decimation:
+            raise ValueError(
+                f"FFT size {fft_size} is not a multiple of decimation {decimation}")
+            
         self.fft_size = fft_size
         self.sample_rate = sample_rate
-        self.window = np.blackman(fft_size)
+        self.decimation = decimation
+        self.num_bins = fft_size // decimation
+        self.window = self._create_window()
+        
+        if next_fast_len(fft_size) != fft_size:
+            logger.warning("FFT size %d is slow to transform; consider %d",
+                           fft_size, next_fast_len(fft_size))
         
+        # Per-frame buffers
+        self._fft_in = np.empty(fft_size, dtype=np.complex64)
+        self._power_db = np.empty(self.num_bins, dtype=np.float32)
+        
+        # Warm up the JIT so the first real frame isn't slow
+        self.process_samples(np.zeros(fft_size, dtype=np.complex64))
+        
+    def _create_window(self) -> np.ndarray:
+        """
+        Create a symmetric 4-term Blackman-Harris window.
         
-        # Pre-compute filter coefficients
-        self.filter_coeffs = self._create_filter()
+        Returns:
+            Float32 window coefficients
+        """
+        coeffs = (0.35875, -0.48829, 0.14128, -0.01168)
+        phase = 2 * np.pi * np.arange(self.fft_size) / max(self.fft_size - 1, 1)
+        window = sum(a * np.cos(k * phase) for k, a in enumerate(coeffs))
+        return window.astype(np.float32)
         
-    def _create_filter(self) -> Tuple[np.ndarray, np.ndarray]:
+    def decimate_freq_range(self, freq_range: np.ndarray) -> np.ndarray:
         """
-        Create Butterworth filter coefficients.
+        Get the frequency axis matching the decimated spectrum.
         
+        Args:
+            freq_range: Frequency range array with one entry per FFT bin
+            
         Returns:
-            Tuple of filter numerator and denominator coefficients
+            Center frequency of each output bin
         """
-        nyquist = 0.5 * self.fft_size
-        cutoff = 0.1 * nyquist
-        return butter(4, cutoff/nyquist)
+        return freq_range.reshape(-1, self.decimation).mean(axis=1)
         
     def process_samples(self, iq_data: np.ndarray) -> Optional[np.ndarray]:
         """
@@ -50,28 +80,25 @@ class SignalProcessor:
             iq_data: Complex IQ samples
             
         Returns:
-            Power spectrum in dB or None if processing fails
+            Float32 power spectrum in dB with num_bins bins, or None if
+            processing fails. The array is reused on the next call; copy it
+            if it needs to be kept.
         """
         try:
             if iq_data is None or len(iq_data) != self.fft_size:
                 return None
                 
-            # Remove DC offset
-            iq_data -= np.mean(iq_data)
-            
-            # Compute FFT
-            fft_data = fftshift(fft(iq_data * self.window))
+            # Remove DC offset and apply window
+            remove_dc_window(iq_data, self.window, self._fft_in)
             
-            # Calculate power spectrum
-            power_db = 20 * np.log10(np.abs(fft_data) + 1e-12)
+            # Compute FFT, letting pocketfft reuse the input buffer
+            fft_data = fft(self._fft_in, overwrite_x=True, workers=-1)
             
-            # Apply filtering
-            power_db_smooth = filtfilt(self.filter_coeffs[0], 
-                                     self.filter_coeffs[1], 
-                                     power_db)
+            # Calculate shifted, decimated power spectrum
+            spectrum_db(fft_data, self._power_db, self.decimation)
             
             logger.debug("Signal processed successfully")
-            return power_db_smooth
+            return self._power_db
             
         except Exception as e:
             logger.error(f"Error processing samples: {str(e)}")
@@ -91,11 +118,12 @@ class SignalProcessor:
             Dictionary containing signal metrics
         """
         try:
+            max_power, mean_power, peak_idx, above = spectrum_reduce(spectrum)
             metrics = {
-                'max_power': np.max(spectrum),
-                'mean_power': np.mean(spectrum),
-                'peak_frequency': freq_range[np.argmax(spectrum)],
-                'bandwidth': self._calculate_bandwidth(spectrum, freq_range)
+                'max_power': max_power,
+                'mean_power': mean_power,
+                'peak_frequency': float(freq_range[peak_idx]),
+                'bandwidth': self._calculate_bandwidth(above, freq_range)
             }
             return metrics
             
@@ -104,22 +132,20 @@ class SignalProcessor:
             return {}
             
     def _calculate_bandwidth(self, 
-                           spectrum: np.ndarray,
+                           above_count: int,
                            freq_range: np.ndarray) -> float:
         """
         Calculate 3dB bandwidth of the strongest signal.
         
         Args:
-            spectrum: Power spectrum in dB
+            above_count: Number of bins within 3dB of the peak
             freq_range: Frequency range array
             
         Returns:
             Bandwidth in Hz
         """
         try:
-            max_power = np.max(spectrum)
-            mask = spectrum > (max_power - 3)  # 3dB bandwidth
-            return np.sum(mask) * (freq_range[1] - freq_range[0]) * 1e6
+            return above_count * float(freq_range[1] - freq_range[0]) * 1e6
             
         except Exception as e:
             logger.error(f"Error calculating bandwidth: {str(e)}")
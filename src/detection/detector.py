@@ -4,9 +4,11 @@ Implements algorithms for detecting and characterizing RF signals.
 """
 
 import logging
+import math
 import numpy as np
 from datetime import datetime
 from typing import Optional, List, Tuple
+from src.core.fast_kernels import spectrum_reduce
 from .events import JammingEvent, DetectionStats
 
 logger = logging.getLogger(__name__)
@@ -21,7 +23,8 @@ class SignalDetector:
         z_score_threshold: float = 1.5,
         detection_window: int = 5,
         min_duration: float = 0.1,
-        test_mode: bool = False
+        test_mode: bool = False,
+        freq_range: Optional[np.ndarray] = None
     ):
         """
         Initialize detector with configuration parameters.
@@ -33,24 +36,40 @@ class SignalDetector:
             detection_window: Number of frames for detection window
             min_duration: Minimum event duration (seconds)
             test_mode: Enable more sensitive detection for testing
+            freq_range: Frequency axis of the spectra passed to detect_signal;
+                if given, its bin spacing is computed once here
         """
         self.power_threshold = power_threshold
         self.bandwidth_threshold = bandwidth_threshold
         self.z_score_threshold = z_score_threshold
+        self._inv_z_thresh = 1.0 / z_score_threshold
         self.detection_window = detection_window
         self.min_duration = min_duration
         self.test_mode = test_mode
         
         # Detection state
-        self.power_history: List[float] = []
+        self._ring: List[float] = [0.0] * detection_window
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sq = 0.0
         self.baseline_mean: Optional[float] = None
         self.baseline_std: Optional[float] = None
+        self._inv_std = 0.0  # 1 / max(baseline_std, 1e-10)
         self.potential_signal = False
         self.signal_start_time: Optional[float] = None
         
+        # Bin spacing in Hz, or None to take it from each frame's freq_range
+        self._df_hz: Optional[float] = None
+        if freq_range is not None:
+            self._df_hz = float(freq_range[1] - freq_range[0]) * 1e6
+        
         # Statistics
         self.stats = DetectionStats()
         
+        # Warm up the JIT so the first real frame isn't slow
+        spectrum_reduce(np.zeros(1, dtype=np.float32))
+        
     def update_baseline(self, spectrum: np.ndarray) -> None:
         """
         Update baseline statistics for detection.
@@ -58,15 +77,36 @@ class SignalDetector:
         Args:
             spectrum: Current power spectrum
         """
-        current_mean = np.mean(spectrum)
-        self.power_history.append(current_mean)
+        self._update_baseline(float(np.mean(spectrum)))
+        
+    def _update_baseline(self, current_mean: float) -> None:
+        """
+        Update baseline statistics from a frame's mean power.
+        
+        Args:
+            current_mean: Mean power of the current spectrum (dB)
+        """
+        # Running sums over a fixed-size ring of frame means
+        evicted = self._count == self.detection_window
+        if evicted:
+            old = self._ring[self._idx]
+            self._sum -= old
+            self._sq -= old * old
+        else:
+            self._count += 1
+        self._ring[self._idx] = current_mean
+        self._sum += current_mean
+        self._sq += current_mean * current_mean
+        self._idx = (self._idx + 1) % self.detection_window
         
-        if len(self.power_history) > self.detection_window:
-            self.power_history.pop(0)
+        if evicted:
+            window_mean = self._sum / self._count
+            window_std = math.sqrt(max(self._sq / self._count -
+                                       window_mean * window_mean, 0.0))
             
             if self.baseline_mean is None:
-                self.baseline_mean = np.mean(self.power_history)
-                self.baseline_std = np.std(self.power_history)
+                self.baseline_mean = window_mean
+                self.baseline_std = window_std
                 logger.info("Baseline established: mean=%.2f dB, std=%.2f dB",
                           self.baseline_mean, self.baseline_std)
             else:
@@ -74,9 +114,9 @@ class SignalDetector:
                 alpha = 0.1
                 self.baseline_mean = ((1 - alpha) * self.baseline_mean + 
                                     alpha * current_mean)
-                new_std = np.std(self.power_history)
                 self.baseline_std = ((1 - alpha) * self.baseline_std + 
-                                   alpha * new_std)
+                                   alpha * window_std)
+            self._inv_std = 1.0 / max(self.baseline_std, 1e-10)
     
     def detect_signal(self, 
                      spectrum: np.ndarray, 
@@ -93,20 +133,21 @@ class SignalDetector:
         Returns:
             JammingEvent if signal detected, None otherwise
         """
-        self.update_baseline(spectrum)
+        # Calculate metrics
+        max_power, current_mean, peak_idx, above = spectrum_reduce(spectrum)
+        
+        self._update_baseline(current_mean)
         
         if self.baseline_mean is None:
             return None
             
-        # Calculate metrics
-        max_power = np.max(spectrum)
-        current_mean = np.mean(spectrum)
-        z_score = ((current_mean - self.baseline_mean) / 
-                  (self.baseline_std + 1e-10))
+        z_score = (current_mean - self.baseline_mean) * self._inv_std
         
         # Calculate bandwidth
-        mask = spectrum > (max_power - 3)
-        bandwidth = np.sum(mask) * (freq_range[1] - freq_range[0]) * 1e6
+        df_hz = self._df_hz
+        if df_hz is None:
+            df_hz = float(freq_range[1] - freq_range[0]) * 1e6
+        bandwidth = above * df_hz
         
         # Detection logic
         detection_criteria = [
@@ -131,11 +172,11 @@ class SignalDetector:
                 # Create event
                 event = JammingEvent(
                     timestamp=datetime.fromtimestamp(timestamp),
-                    frequency=freq_range[np.argmax(spectrum)],
+                    frequency=float(freq_range[peak_idx]),
                     power=max_power,
                     bandwidth=bandwidth,
                     duration=duration,
-                    confidence=abs(z_score) / self.z_score_threshold,
+                    confidence=abs(z_score) * self._inv_z_thresh,
                     snr=max_power - self.baseline_mean
                 )
                 logger.info(f"Signal confirmed: {event.to_dict()}")
@@ -4,10 +4,10 @@ Handles waterfall and spectrum plotting using matplotlib.
 """
 
 import logging
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from collections import deque
 from typing import Optional, Tuple
 from src.detection.events import JammingEvent
 
@@ -35,20 +35,24 @@ class SpectrumPlotter:
         self.update_interval = update_interval
         self.animation = None
 
-        # Waterfall data buffer
-        self.waterfall_data = deque(
-            [np.full(len(freq_range), -100) for _ in range(waterfall_length)],
-            maxlen=waterfall_length
-        )
+        # Waterfall data buffer, stored twice so the newest-first
+        # window is always a contiguous view
+        self._wf = np.full((2 * waterfall_length, len(freq_range)), -100,
+                           dtype=np.float32)
+        self._wf_head = 0
+        
+        # Dynamic range tracking, applied at most once per second
+        self._ylim_ema = (-100.0, -30.0)
+        self._ylim = self._ylim_ema
+        self._last_ylim_update = 0.0
         
+        # Event marker auto-hides after this many frames without an event
+        self.marker_frames = 20
+        self._marker_ttl = 0
         
         # Initialize plot components
         self._setup_plot()
         
-
-        # Event markers
-        self.event_markers = []
-        
     def _setup_plot(self) -> None:
         """Set up the matplotlib figure and axes."""
         plt.style.use('dark_background')
@@ -67,15 +71,30 @@ class SpectrumPlotter:
                 spine.set_color('#444444')
         
         # Spectrum plot
-        self.line_spectrum, = self.ax_spectrum.plot([], [], 'w-', lw=1)
+        # x-data is set once here; updates only replace the y-data
+        self.line_spectrum, = self.ax_spectrum.plot(
+            self.freq_range,
+            np.full(len(self.freq_range), np.nan, dtype=np.float32),
+            'w-', lw=1
+        )
         self.ax_spectrum.set_xlim(self.freq_range[0], self.freq_range[-1])
-        self.ax_spectrum.set_ylim(-100, -30)
+        self.ax_spectrum.set_ylim(*self._ylim)
         self.ax_spectrum.set_ylabel('Power (dB)', color='white')
         self.ax_spectrum.grid(True, color='#333333', alpha=0.5)
         
+        # Event marker, moved and shown when a detection occurs
+        self._marker = self.ax_spectrum.axvline(
+            x=self.freq_range[0],
+            color='r',
+            alpha=0.5,
+            linestyle='--',
+            visible=False,
+            animated=True
+        )
+        
         # Waterfall plot
         self.waterfall_img = self.ax_waterfall.imshow(
-            np.array(self.waterfall_data),
+            self._wf[:self.waterfall_length],
             aspect='auto',
             cmap='jet',
             extent=[self.freq_range[0], self.freq_range[-1], 0, self.waterfall_length],
@@ -96,38 +115,62 @@ class SpectrumPlotter:
             event: Optional detection event to mark
         """
         # Update spectrum line
-        self.line_spectrum.set_data(self.freq_range, spectrum)
+        self.line_spectrum.set_ydata(spectrum)
         
         # Update waterfall
-        self.waterfall_data.appendleft(spectrum)
-        self.waterfall_img.set_array(np.array(self.waterfall_data))
+        self._wf_head = (self._wf_head - 1) % self.waterfall_length
+        self._wf[self._wf_head] = spectrum
+        self._wf[self._wf_head + self.waterfall_length] = spectrum
+        self.waterfall_img.set_data(
+            self._wf[self._wf_head:self._wf_head + self.waterfall_length])
         
-        # Mark detection event
+        # Mark detection event, hiding stale markers
         if event:
             self._mark_event(event)
+        elif self._marker_ttl > 0:
+            self._marker_ttl -= 1
+            if self._marker_ttl == 0:
+                self._marker.set_visible(False)
             
-        # Dynamic range adjustment
-        pmin, pmax = np.min(spectrum), np.max(spectrum)
-        self.ax_spectrum.set_ylim(pmin - 10, pmax + 10)
-        self.waterfall_img.set_clim(pmin - 10, pmax + 10)
+        self._adjust_range(spectrum)
 
-        return [self.line_spectrum, self.waterfall_img] + self.event_markers
+        return [self.line_spectrum, self.waterfall_img, self._marker]
+        
+    def _adjust_range(self, spectrum: np.ndarray) -> None:
+        """
+        Track the spectrum's dynamic range and rescale the plots when it drifts.
+        
+        Changing limits invalidates the blit background, so limits are only
+        applied once per second and only when they move by more than 3 dB.
+        
+        Args:
+            spectrum: New spectrum data
+        """
+        alpha = 0.1
+        lo, hi = self._ylim_ema
+        lo += alpha * (float(np.min(spectrum)) - 10 - lo)
+        hi += alpha * (float(np.max(spectrum)) + 10 - hi)
+        self._ylim_ema = (lo, hi)
+        
+        now = time.monotonic()
+        if now - self._last_ylim_update <= 1.0:
+            return
+        if abs(lo - self._ylim[0]) <= 3 and abs(hi - self._ylim[1]) <= 3:
+            return
+            
+        self._ylim = self._ylim_ema
+        self._last_ylim_update = now
+        self.ax_spectrum.set_ylim(lo, hi)
+        self.waterfall_img.set_clim(lo, hi)
+        
+        # Redraw once so the blit background picks up the new axes
+        self.fig.canvas.draw()
         
     def _mark_event(self, event: JammingEvent) -> None:
         """Mark a detection event on the plot."""
-        # Remove old markers
-        for marker in self.event_markers:
-            marker.remove()
-        self.event_markers.clear()
-        
-        # Add new marker
-        marker = self.ax_spectrum.axvline(
-            x=event.frequency,
-            color='r',
-            alpha=0.5,
-            linestyle='--'
-        )
-        self.event_markers.append(marker)
+        self._marker.set_xdata([event.frequency, event.frequency])
+        self._marker.set_visible(True)
+        self._marker_ttl = self.marker_frames
         
     def start(self, update_func) -> None:
         """
@@ -153,4 +196,4 @@ class SpectrumPlotter:
     def get_artists(self):
         """Return all plot artists."""
         logger.debug("Returning plot artists")
-        return [self.line_spectrum, self.waterfall_img] + self.event_markers
\ No newline at end of file
+        return [self.line_spectrum, self.waterfall_img, self._marker]
\ No newline at end of file
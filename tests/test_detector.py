@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from src.detection.detector import SignalDetector
+
+class TestSignalDetector(unittest.TestCase):
+
+    def setUp(self):
+        self.window = 5
+        self.detector = SignalDetector(detection_window=self.window)
+
+        # Frame means drifting around a -60 dB noise floor
+        rng = np.random.default_rng(0)
+        self.means = -60 + rng.standard_normal(40)
+
+    def test_no_baseline_until_window_full(self):
+        for mean in self.means[:self.window]:
+            self.detector.update_baseline(np.full(16, mean))
+
+        self.assertIsNone(self.detector.baseline_mean)
+
+    def test_baseline_matches_numpy(self):
+        # Reference implementation over an explicit history list
+        history = []
+        baseline_mean = baseline_std = None
+        alpha = 0.1
+        for mean in self.means:
+            self.detector.update_baseline(np.full(16, mean))
+
+            history.append(mean)
+            if len(history) > self.window:
+                history.pop(0)
+                if baseline_mean is None:
+                    baseline_mean = np.mean(history)
+                    baseline_std = np.std(history)
+                else:
+                    baseline_mean = (1 - alpha) * baseline_mean + alpha * mean
+                    baseline_std = (1 - alpha) * baseline_std + alpha * np.std(history)
+
+                self.assertAlmostEqual(self.detector.baseline_mean, baseline_mean, places=4)
+                self.assertAlmostEqual(self.detector.baseline_std, baseline_std, places=4)
+
+    def test_bandwidth_uses_constructor_freq_range(self):
+        freq_range = np.linspace(99, 101, 64)
+        detector = SignalDetector(detection_window=2, min_duration=0,
+                                  test_mode=True, freq_range=freq_range)
+        spectrum = np.full(64, -80.0, dtype=np.float32)
+        spectrum[30:33] = -40.0
+
+        events = [detector.detect_signal(spectrum, freq_range, float(t))
+                  for t in range(4)]
+
+        # Three bins within 3dB of the peak
+        self.assertIsNotNone(events[-1])
+        self.assertAlmostEqual(events[-1].bandwidth,
+                               3 * (freq_range[1] - freq_range[0]) * 1e6)
+
+if __name__ == '__main__':
+    unittest.main()
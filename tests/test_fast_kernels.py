@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from src.core.fast_kernels import unpack_iq
+from src.core.signal_processor import SignalProcessor
+from src.detection.detector import SignalDetector
+
+class TestKernelDtypes(unittest.TestCase):
+    """Double precision inputs must work whether or not the AOT kernels are built."""
+
+    def setUp(self):
+        self.fft_size = 1024
+        self.freq_range = np.linspace(99, 101, self.fft_size)
+        rng = np.random.default_rng(0)
+        self.iq = (rng.standard_normal(self.fft_size) +
+                   1j * rng.standard_normal(self.fft_size))
+
+    def test_process_samples_complex128(self):
+        processor = SignalProcessor(fft_size=self.fft_size, sample_rate=2.048e6)
+        reference = processor.process_samples(self.iq.astype(np.complex64)).copy()
+
+        spectrum = processor.process_samples(self.iq)
+        np.testing.assert_allclose(spectrum, reference, atol=1e-2)
+
+    def test_signal_metrics_float64(self):
+        processor = SignalProcessor(fft_size=self.fft_size, sample_rate=2.048e6)
+        spectrum = -60 + np.arange(self.fft_size, dtype=np.float64) % 7
+
+        metrics = processor.calculate_signal_metrics(spectrum, self.freq_range)
+        self.assertAlmostEqual(metrics['max_power'], np.max(spectrum))
+        self.assertAlmostEqual(metrics['mean_power'], np.mean(spectrum))
+
+    def test_detect_signal_float64(self):
+        detector = SignalDetector()
+        spectrum = np.full(self.fft_size, -60.0)
+
+        for t in range(10):
+            detector.detect_signal(spectrum, self.freq_range, float(t))
+        self.assertAlmostEqual(detector.baseline_mean, -60.0)
+
+    def test_unpack_iq_complex128(self):
+        raw = np.array([255, 0] * self.fft_size, dtype=np.uint8)
+        out = np.empty(self.fft_size, dtype=np.complex128)
+
+        unpack_iq(raw, out)
+        np.testing.assert_allclose(out, 1 - 1j, atol=1e-2)
+
+if __name__ == '__main__':
+    unittest.main()
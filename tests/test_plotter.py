@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from src.detection.events import JammingEvent
+from src.visualization.plotter import SpectrumPlotter
+
+class TestSpectrumPlotter(unittest.TestCase):
+
+    def setUp(self):
+        self.length = 8
+        self.freq_range = np.linspace(99, 101, 16)
+        self.plotter = SpectrumPlotter(self.freq_range, waterfall_length=self.length)
+
+    def tearDown(self):
+        plt.close(self.plotter.fig)
+
+    def _frame(self, value):
+        return np.full(len(self.freq_range), value, dtype=np.float32)
+
+    def _event(self, frequency):
+        return JammingEvent(
+            timestamp=datetime.now(),
+            frequency=frequency,
+            power=-40.0,
+            bandwidth=1e5,
+            duration=0.5,
+            confidence=2.0,
+            snr=20.0
+        )
+
+    def test_waterfall_newest_first(self):
+        # Wrap the ring more than once
+        updates = 2 * self.length + 3
+        for i in range(updates):
+            self.plotter.update(self._frame(i))
+
+        head = self.plotter._wf_head
+        window = self.plotter._wf[head:head + self.length]
+
+        # Row 0 is the newest frame, the last row the oldest still shown
+        expected = np.arange(updates - 1, updates - 1 - self.length, -1)
+        np.testing.assert_array_equal(window[:, 0], expected)
+        np.testing.assert_array_equal(window, window[:, :1].repeat(len(self.freq_range), axis=1))
+
+    def test_waterfall_image_follows_every_frame(self):
+        for i in range(3):
+            self.plotter.update(self._frame(i))
+
+            # The newest frame is shown on the top row immediately
+            image = self.plotter.waterfall_img.get_array()
+            np.testing.assert_array_equal(image[:i + 1, 0], np.arange(i, -1, -1))
+
+    def test_marker_hides_after_ttl(self):
+        self.plotter.update(self._frame(-60), self._event(100.5))
+        self.assertTrue(self.plotter._marker.get_visible())
+        self.assertEqual(list(self.plotter._marker.get_xdata()), [100.5, 100.5])
+
+        for _ in range(self.plotter.marker_frames - 1):
+            self.plotter.update(self._frame(-60))
+        self.assertTrue(self.plotter._marker.get_visible())
+
+        self.plotter.update(self._frame(-60))
+        self.assertFalse(self.plotter._marker.get_visible())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import time
+import socket
+import unittest
+import numpy as np
+from src.core.rtlsdr_base import RTLSDRBase
+from src.core.reader_thread import SampleReader
+
+class TestSampleReader(unittest.TestCase):
+
+    def setUp(self):
+        # A local socket pair stands in for the RTL-TCP connection
+        self.server, client = socket.socketpair()
+        client.setblocking(0)
+
+        self.rtl_sdr = RTLSDRBase(
+            host='localhost',
+            port=1234,
+            center_freq=100e6,
+            fft_size=1024
+        )
+        self.rtl_sdr.sock = client
+        self.reader = SampleReader(self.rtl_sdr)
+
+    def tearDown(self):
+        self.reader.stop()
+        self.rtl_sdr._cleanup()
+        self.server.close()
+
+    def _wait_for_block(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            samples = self.reader.latest()
+            if samples is not None:
+                return samples
+            time.sleep(0.01)
+        return None
+
+    def test_latest_before_data(self):
+        self.reader.start()
+
+        # Nothing has been sent yet
+        self.assertIsNone(self.reader.latest())
+
+    def test_latest_returns_newest_block(self):
+        self.reader.start()
+
+        # I=255, Q=0 for every sample
+        self.server.sendall(bytes([255, 0]) * 1024)
+        samples = self._wait_for_block()
+
+        self.assertIsNotNone(samples)
+        self.assertEqual(samples.shape[0], 1024)
+        self.assertEqual(samples.dtype, np.complex64)
+        np.testing.assert_allclose(samples, 1 - 1j, atol=1e-2)
+
+    def test_exits_when_server_closes(self):
+        self.reader.start()
+        self.server.close()
+        self.reader.join(2.0)
+
+        self.assertFalse(self.reader.is_alive())
+
+    def test_rejects_too_few_buffers(self):
+        with self.assertRaises(ValueError):
+            SampleReader(self.rtl_sdr, num_buffers=2)
+
+    def test_stop(self):
+        self.reader.start()
+        self.reader.stop()
+
+        self.assertFalse(self.reader.is_alive())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,159 +1,146 @@
+import os
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 import socket
-import numpy as np
-from src.core.rtlsdr_base import RTLSDRBase, RTLSDRException  # Replace with the correct import
+from src.core.rtlsdr_base import RCVBUF_SIZE, RTLSDRBase, RTLSDRException  # Replace with the correct import
 
+# One frame of raw IQ bytes (fft_size=1024) shared by read tests; built once at import
+_RAW_DATA = os.urandom(2 * 1024)
+
+_AF_INET, _SOCK_STREAM = socket.AF_INET, socket.SOCK_STREAM
+_ADDR = ('localhost', 1234)
+
+class _FakeSock:
+    """Stand-in socket exposing only the methods RTLSDRBase calls."""
+
+    def __init__(self):
+        self.connect = Mock()
+        self.setblocking = Mock()
+        self.setsockopt = Mock()
+        self.getsockopt = Mock(return_value=RCVBUF_SIZE)
+        self.recv_into = Mock()
+        self.send = Mock()
+        self.close = Mock()
+
+    def reset_mock(self):
+        for method in vars(self).values():
+            method.reset_mock()
+
+@patch('socket.socket')
 class TestRTLSDRBase(unittest.TestCase):
 
-    @patch('socket.socket')
+    def setUp(self):
+        self.kwargs = dict(
+            host=_ADDR[0],
+            port=_ADDR[1],
+            center_freq=100e6,
+            sample_rate=2.048e6,
+            fft_size=1024
+        )
+
+    def _make_connected(self):
+        """Build an RTLSDRBase with a mock socket already attached."""
+        rtl = RTLSDRBase(**self.kwargs)
+        mock_sock = _FakeSock()
+        rtl.sock = mock_sock
+        return rtl, mock_sock
+
     def test_connect_success(self, MockSocket):
         # Mock socket behavior for successful connection
-        mock_socket_instance = MagicMock()
+        mock_socket_instance = _FakeSock()
         MockSocket.return_value = mock_socket_instance
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6
-        )
-        
+
+        rtl_sdr = RTLSDRBase(**self.kwargs)
+
         # Call the connect method
         rtl_sdr.connect()
-        
+
         # Check if socket connection was established
-        MockSocket.assert_called_with(socket.AF_INET, socket.SOCK_STREAM)
-        mock_socket_instance.connect.assert_called_with(('localhost', 1234))
+        MockSocket.assert_called_with(_AF_INET, _SOCK_STREAM)
+        mock_socket_instance.connect.assert_called_with(_ADDR)
         mock_socket_instance.setblocking.assert_called_with(0)
-        
-    @patch('socket.socket')
+
+        # Check the socket was tuned for the sample stream
+        mock_socket_instance.setsockopt.assert_any_call(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        mock_socket_instance.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, RCVBUF_SIZE)
+
     def test_connect_failure(self, MockSocket):
         # Simulate socket error during connection
         MockSocket.side_effect = socket.error("Connection failed")
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6
-        )
-        
+
+        rtl_sdr = RTLSDRBase(**self.kwargs)
+
         # Test if RTLSDRException is raised
         with self.assertRaises(RTLSDRException):
             rtl_sdr.connect()
-        
-    @patch('socket.socket')
-    def test_read_samples_success(self, MockSocket):
-        # Mock socket behavior for receiving data
-        mock_socket_instance = MagicMock()
-        MockSocket.return_value = mock_socket_instance
-        
-        # Simulate receiving raw data
-        raw_data = np.random.randint(0, 256, 2 * 1024 * 64, dtype=np.uint8).tobytes()
-        mock_socket_instance.recv.return_value = raw_data
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6, 
-            sample_rate=2.048e6,
-            fft_size=1024
-        )
-        
-        rtl_sdr.sock = mock_socket_instance
-        
-        # Call the read_samples method
-        samples = rtl_sdr.read_samples()
-        
-        # Check if we received the correct number of samples
-        self.assertEqual(samples.shape[0], 1024)
-        
-    @patch('socket.socket')
-    def test_read_samples_no_data(self, MockSocket):
-        # Mock socket behavior for no data available
-        mock_socket_instance = MagicMock()
-        MockSocket.return_value = mock_socket_instance
-        
-        # Simulate receiving no data
-        mock_socket_instance.recv.return_value = b''
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6, 
-            sample_rate=2.048e6,
-            fft_size=1024
-        )
-        
-        rtl_sdr.sock = mock_socket_instance
-        
-        # Call the read_samples method
-        samples = rtl_sdr.read_samples()
-        
-        # Ensure that the returned samples are None
-        self.assertIsNone(samples)
-        
-    @patch('socket.socket')
+
+    def test_read_samples(self, MockSocket):
+        rtl_sdr, mock_socket_instance = self._make_connected()
+
+        # Deliver exactly one frame, then report the socket as drained
+        def recv_into(buffer):
+            buffer[:len(_RAW_DATA)] = _RAW_DATA
+            mock_socket_instance.recv_into.side_effect = BlockingIOError
+            return len(_RAW_DATA)
+
+        # (case, recv_into side effect, expected sample count or None)
+        cases = [
+            ('frame', recv_into, 1024),
+            ('no_data', BlockingIOError, None),
+        ]
+
+        for name, side_effect, expected in cases:
+            with self.subTest(case=name):
+                mock_socket_instance.reset_mock()
+                mock_socket_instance.recv_into.side_effect = side_effect
+
+                # Call the read_samples method
+                samples = rtl_sdr.read_samples()
+
+                if expected is None:
+                    self.assertIsNone(samples)
+                else:
+                    self.assertEqual(samples.shape[0], expected)
+                    self.assertEqual(mock_socket_instance.recv_into.call_count, 2)
+
+    def test_read_samples_closed(self, MockSocket):
+        rtl_sdr, mock_socket_instance = self._make_connected()
+
+        # An empty read means the server closed the connection
+        mock_socket_instance.recv_into.return_value = 0
+
+        with self.assertRaises(RTLSDRException):
+            rtl_sdr.read_samples()
+
     def test_send_command_failure(self, MockSocket):
-        # Simulate a socket error during command sending
-        mock_socket_instance = MagicMock()
-        MockSocket.return_value = mock_socket_instance
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6, 
-            sample_rate=2.048e6,
-            fft_size=1024
-        )
-        
-        rtl_sdr.sock = mock_socket_instance
-        
+        rtl_sdr, mock_socket_instance = self._make_connected()
+
         # Simulate a socket error when sending command
         mock_socket_instance.send.side_effect = socket.error("Send failed")
-        
+
         # Test if RTLSDRException is raised
         with self.assertRaises(RTLSDRException):
             rtl_sdr._send_command(0x01, int(100e6))
-        
-    @patch('socket.socket')
+
     def test_cleanup(self, MockSocket):
         # Test cleanup behavior when closing the socket
-        mock_socket_instance = MagicMock()
-        MockSocket.return_value = mock_socket_instance
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6
-        )
-        
-        rtl_sdr.sock = mock_socket_instance
-        
+        rtl_sdr, mock_socket_instance = self._make_connected()
+
         # Call cleanup manually
         rtl_sdr._cleanup()
-        
+
         # Verify that the socket was closed
         mock_socket_instance.close.assert_called_once()
-        
-    @patch('socket.socket')
+
     def test_device_configuration_failure(self, MockSocket):
         # Simulate failure during device configuration
-        mock_socket_instance = MagicMock()
-        MockSocket.return_value = mock_socket_instance
-        
-        rtl_sdr = RTLSDRBase(
-            host='localhost', 
-            port=1234, 
-            center_freq=100e6, 
-            sample_rate=2.048e6,
-            fft_size=1024
-        )
-        
-        rtl_sdr.sock = mock_socket_instance
-        
+        rtl_sdr, mock_socket_instance = self._make_connected()
+
         # Simulate an error during device configuration
-        rtl_sdr._send_command = MagicMock(side_effect=RTLSDRException("Configuration error"))
-        
+        rtl_sdr._send_command = Mock(side_effect=RTLSDRException("Configuration error"))
+
         # Test if RTLSDRException is raised during the configuration
         with self.assertRaises(RTLSDRException):
             rtl_sdr.connect()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from scipy.signal.windows import blackmanharris
+from src.core.signal_processor import SignalProcessor
+
+class TestSignalProcessor(unittest.TestCase):
+
+    def setUp(self):
+        self.fft_size = 2048
+        self.processor = SignalProcessor(
+            fft_size=self.fft_size, sample_rate=2.048e6, decimation=8)
+
+        # Noise plus a tone, quantized like 8-bit ADC samples
+        rng = np.random.default_rng(0)
+        t = np.arange(self.fft_size)
+        iq = 0.1 * (rng.standard_normal(self.fft_size) +
+                    1j * rng.standard_normal(self.fft_size))
+        iq += 0.5 * np.exp(2j * np.pi * 0.1 * t)
+        self.iq = np.round(iq * 127.5) / 127.5
+
+    def _reference_spectrum(self, iq):
+        # Float64 reference of the same pipeline
+        iq = (iq - np.mean(iq)) * blackmanharris(self.fft_size)
+        power_db = 20 * np.log10(np.abs(np.fft.fftshift(np.fft.fft(iq))) + 1e-12)
+        return power_db.reshape(-1, self.processor.decimation).mean(axis=1)
+
+    def test_process_samples_float32(self):
+        spectrum = self.processor.process_samples(self.iq.astype(np.complex64))
+
+        # Check the spectrum is single precision and decimated
+        self.assertEqual(spectrum.dtype, np.float32)
+        self.assertEqual(spectrum.shape[0], self.fft_size // self.processor.decimation)
+
+    def test_process_samples_matches_float64(self):
+        spectrum = self.processor.process_samples(self.iq.astype(np.complex64))
+
+        # Single precision should agree with the float64 pipeline to 0.01 dB
+        np.testing.assert_array_almost_equal(
+            spectrum, self._reference_spectrum(self.iq), decimal=2)
+
+    def test_signal_metrics_match_numpy(self):
+        spectrum = self.processor.process_samples(self.iq.astype(np.complex64))
+        freq_range = self.processor.decimate_freq_range(np.linspace(99, 101, self.fft_size))
+
+        metrics = self.processor.calculate_signal_metrics(spectrum, freq_range)
+
+        # Fused reduction should match the separate NumPy reductions
+        self.assertAlmostEqual(metrics['max_power'], np.max(spectrum), places=4)
+        self.assertAlmostEqual(metrics['mean_power'], np.mean(spectrum), places=4)
+        self.assertEqual(metrics['peak_frequency'], freq_range[np.argmax(spectrum)])
+        self.assertAlmostEqual(
+            metrics['bandwidth'],
+            np.sum(spectrum > np.max(spectrum) - 3) * (freq_range[1] - freq_range[0]) * 1e6)
+
+    def test_bandwidth_follows_freq_range(self):
+        spectrum = self.processor.process_samples(self.iq.astype(np.complex64))
+        above = np.sum(spectrum > np.max(spectrum) - 3)
+
+        # Each call uses the bin spacing of the axis it is given
+        for span in (2, 1):
+            freq_range = np.linspace(100 - span / 2, 100 + span / 2, len(spectrum))
+            metrics = self.processor.calculate_signal_metrics(spectrum, freq_range)
+            self.assertAlmostEqual(
+                metrics['bandwidth'], above * (freq_range[1] - freq_range[0]) * 1e6)
+
+    def test_default_keeps_full_resolution(self):
+        processor = SignalProcessor(fft_size=self.fft_size, sample_rate=2.048e6)
+        spectrum = processor.process_samples(self.iq.astype(np.complex64))
+
+        self.assertEqual(spectrum.shape[0], self.fft_size)
+
+    def test_decimation_must_divide_fft_size(self):
+        with self.assertRaises(ValueError):
+            SignalProcessor(fft_size=self.fft_size, sample_rate=2.048e6, decimation=3)
+
+    def test_process_samples_wrong_size(self):
+        # Frames of the wrong length are rejected
+        self.assertIsNone(self.processor.process_samples(
+            np.zeros(self.fft_size // 2, dtype=np.complex64)))
+
+if __name__ == '__main__':
+    unittest.main()